@@ -1,5 +1,14 @@
 from setuptools import setup, find_packages
 
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        ["src/calculators/_keyword.pyx"], language_level=3
+    )
+except ImportError:
+    # Cython is optional; the package falls back to pure Python
+    ext_modules = []
+
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
@@ -13,6 +22,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/aldojacopovirno/SemanticRetrievalEngine",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -34,13 +44,18 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "torch>=1.9.0",
+        "torch>=1.12.0",
         "transformers>=4.5.0",
         "scikit-learn>=0.24.0",
         "numpy>=1.19.0",
     ],
     extras_require={
+        "onnx": [
+            "onnx>=1.10",
+            "onnxruntime>=1.10",
+        ],
         "dev": [
+            "Cython>=0.29",
             "pytest>=6.0",
             "pytest-cov>=2.0",
             "black>=21.0",
@@ -0,0 +1,60 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Cython hot loop for per-document keyword scanning.
+
+Compiled when Cython is available at build time; relevance_calculator
+falls back to its inverted index when this extension is not built.
+"""
+
+cpdef tuple scan(str doc, str keyword):
+    """
+    Single-pass whitespace tokenization and keyword count over ``doc``.
+
+    Tokens are compared case-insensitively against ``keyword``, which is
+    expected to be lowercase already. Token boundaries match the
+    semantics of ``str.split()``.
+
+    Parameters
+    ----------
+    doc : str
+        The raw document text.
+    keyword : str
+        The lowercase keyword to count.
+
+    Returns
+    -------
+    tuple of (int, int, int)
+        (keyword_count, position_sum, word_count), where positions are
+        zero-based token indices.
+    """
+    cdef Py_ssize_t n = len(doc)
+    cdef Py_ssize_t keyword_length = len(keyword)
+    cdef Py_ssize_t i = 0, j, start
+    cdef Py_ssize_t count = 0, position_sum = 0, word_index = 0
+    cdef Py_UCS4 ch
+    cdef bint match
+
+    while i < n:
+        ch = doc[i]
+        if ch.isspace():
+            i += 1
+            continue
+
+        # Consume one token
+        start = i
+        while i < n and not doc[i].isspace():
+            i += 1
+
+        if i - start == keyword_length:
+            match = True
+            for j in range(keyword_length):
+                if doc[start + j].lower() != keyword[j]:
+                    match = False
+                    break
+            if match:
+                count += 1
+                position_sum += word_index
+
+        word_index += 1
+
+    return count, position_sum, word_index
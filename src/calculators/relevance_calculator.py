@@ -1,23 +1,29 @@
 """
 Module for calculating overall document relevance scores.
 """
-from typing import List, Tuple
-from dataclasses import dataclass
+from typing import List, Optional, Tuple
 import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
 
-@dataclass
-class RelevanceMetrics:
-    """Container for document relevance metrics."""
-    filename: str
-    relevance_score: float
-    similarity_score: float
-    tfidf_score: float
-    keyword_count: int
-    keyword_percentage: float
-    avg_keyword_position: float
+try:
+    from ._keyword import scan as _scan
+except ImportError:
+    # Cython extension not built; keyword metrics use the inverted index
+    _scan = None
+
+# Structure-of-arrays layout for relevance results: one contiguous
+# allocation, sortable with np.argsort instead of Python comparisons
+RELEVANCE_DTYPE = np.dtype([
+    ('filename', 'U256'),
+    ('relevance', 'f4'),
+    ('similarity', 'f4'),
+    ('tfidf', 'f4'),
+    ('count', 'i4'),
+    ('percentage', 'f4'),
+    ('avg_pos', 'f4'),
+])
 
 class RelevanceCalculator:
     """
@@ -43,6 +49,16 @@ class RelevanceCalculator:
         
         self.documents = documents
         self.filenames = filenames
+        # Tokenize once; every query reuses these instead of re-splitting
+        self._doc_words = [doc.lower().split() for doc in documents]
+        self._doc_lens = np.array(
+            [len(words) for words in self._doc_words], dtype=np.int64
+        )
+        # Inverted index: token -> {doc_idx: [positions]}, so per-query
+        # keyword metrics cost O(postings) instead of a corpus scan. Built
+        # lazily: when the compiled scan extension is available, queries use
+        # it directly and the index is never needed.
+        self._index: Optional[dict] = None
         self.weights = weights or {
             'similarity': 0.4,
             'tfidf': 0.3,
@@ -56,58 +72,72 @@ class RelevanceCalculator:
             total = sum(self.weights.values())
             self.weights = {k: v/total for k, v in self.weights.items()}
 
-    def _calculate_keyword_metrics(self, document: str, keyword: str) -> Tuple[int, float, float]:
+    def _calculate_keyword_metrics(self, index: int, keyword: str) -> Tuple[int, float, float]:
         """
         Calculate keyword-related metrics for a single document.
-        
+
         Parameters
         ----------
-        document : str
-            The document text to analyze.
+        index : int
+            The index of the document to analyze.
         keyword : str
             The keyword to search for.
-            
+
         Returns
         -------
         Tuple[int, float, float]
             Returns (keyword_count, percentage_occurrence, avg_position)
         """
         try:
-            words = document.lower().split()
-            word_count = len(words)
-            
+            word_count = self._doc_lens[index]
+
             if word_count == 0:
                 logger.warning("Empty document found")
                 return 0, 0.0, -1.0
-            
-            # Find keyword occurrences and positions
-            keyword = keyword.lower()
-            keyword_positions = [i for i, word in enumerate(words) if word == keyword]
-            keyword_count = len(keyword_positions)
-            
+
+            if _scan is not None:
+                # Compiled single-pass scan over the raw document
+                keyword_count, position_sum, _ = _scan(
+                    self.documents[index], keyword.lower()
+                )
+            else:
+                # Postings lookup in the inverted index; no document scan
+                if self._index is None:
+                    self._build_index()
+                positions = self._index.get(keyword.lower(), {}).get(index, [])
+                keyword_count = len(positions)
+                position_sum = sum(positions)
+
             # Calculate percentage and average position
             percentage = (keyword_count / word_count) * 100
             avg_position = (
-                sum(keyword_positions) / keyword_count 
-                if keyword_count > 0 
+                position_sum / keyword_count
+                if keyword_count > 0
                 else -1.0
             )
-            
+
             return keyword_count, percentage, avg_position
-            
+
         except Exception as e:
             logger.error(f"Error calculating keyword metrics: {str(e)}")
             return 0, 0.0, -1.0
 
+    def _build_index(self) -> None:
+        """Builds the inverted index over the pre-tokenized documents."""
+        self._index = {}
+        for i, words in enumerate(self._doc_words):
+            for position, word in enumerate(words):
+                self._index.setdefault(word, {}).setdefault(i, []).append(position)
+
     def calculate_relevance(
         self,
         cosine_similarities: List[float],
         tfidf_scores: List[float],
         keyword: str
-    ) -> List[RelevanceMetrics]:
+    ) -> np.ndarray:
         """
         Calculates the relevance score for each document.
-        
+
         Parameters
         ----------
         cosine_similarities : list of float
@@ -116,61 +146,46 @@ class RelevanceCalculator:
             TF-IDF scores for the documents.
         keyword : str
             The keyword used for calculating relevance.
-            
+
         Returns
         -------
-        list of RelevanceMetrics
-            Relevance metrics for each document.
+        numpy.ndarray
+            Structured array of RELEVANCE_DTYPE, one row per document.
         """
         if not all(len(lst) == len(self.documents) for lst in [cosine_similarities, tfidf_scores]):
             raise ValueError("Length of similarity and TF-IDF scores must match number of documents")
 
-        results = []
-        
-        for idx, (doc, filename) in enumerate(zip(self.documents, self.filenames)):
-            try:
-                # Calculate keyword metrics
-                keyword_count, keyword_percentage, avg_position = self._calculate_keyword_metrics(doc, keyword)
-                
-                # Normalize position score (0 to 1, where 1 is better - appearing earlier in document)
-                position_score = (
-                    1 - (avg_position / len(doc.split())) 
-                    if avg_position >= 0 
-                    else 0
-                )
-                
-                # Calculate weighted relevance score
-                relevance_score = (
-                    self.weights['similarity'] * cosine_similarities[idx] +
-                    self.weights['tfidf'] * tfidf_scores[idx] +
-                    self.weights['keyword_occurrence'] * (keyword_percentage / 100) +
-                    self.weights['position'] * position_score
-                )
-                
-                # Create metrics object
-                metrics = RelevanceMetrics(
-                    filename=filename,
-                    relevance_score=float(relevance_score),
-                    similarity_score=float(cosine_similarities[idx]),
-                    tfidf_score=float(tfidf_scores[idx]),
-                    keyword_count=keyword_count,
-                    keyword_percentage=float(keyword_percentage),
-                    avg_keyword_position=float(avg_position)
-                )
-                
-                results.append(metrics)
-                
-            except Exception as e:
-                logger.error(f"Error calculating relevance for document {filename}: {str(e)}")
-                # Add a zero-scored result in case of error
-                results.append(RelevanceMetrics(
-                    filename=filename,
-                    relevance_score=0.0,
-                    similarity_score=0.0,
-                    tfidf_score=0.0,
-                    keyword_count=0,
-                    keyword_percentage=0.0,
-                    avg_keyword_position=-1.0
-                ))
-        
+        num_documents = len(self.documents)
+
+        # Gather keyword metrics into arrays
+        counts = np.empty(num_documents, dtype=np.int64)
+        percentages = np.empty(num_documents, dtype=np.float64)
+        positions = np.empty(num_documents, dtype=np.float64)
+        for idx in range(num_documents):
+            counts[idx], percentages[idx], positions[idx] = (
+                self._calculate_keyword_metrics(idx, keyword)
+            )
+
+        # Normalize position score (0 to 1, where 1 is better - appearing
+        # earlier in document); one fused expression for all documents
+        doc_lens = np.maximum(self._doc_lens, 1)
+        position_scores = np.where(positions >= 0, 1 - positions / doc_lens, 0.0)
+
+        similarities = np.asarray(cosine_similarities, dtype=np.float64)
+        tfidf = np.asarray(tfidf_scores, dtype=np.float64)
+        relevance_scores = (
+            self.weights['similarity'] * similarities +
+            self.weights['tfidf'] * tfidf +
+            self.weights['keyword_occurrence'] * (percentages / 100) +
+            self.weights['position'] * position_scores
+        )
+
+        results = np.empty(num_documents, dtype=RELEVANCE_DTYPE)
+        results['filename'] = self.filenames
+        results['relevance'] = relevance_scores
+        results['similarity'] = similarities
+        results['tfidf'] = tfidf
+        results['count'] = counts
+        results['percentage'] = percentages
+        results['avg_pos'] = positions
         return results
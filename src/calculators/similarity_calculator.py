@@ -2,15 +2,21 @@
 Module for calculating semantic similarity between documents.
 """
 
-from typing import List
+from typing import List, Optional
+from pathlib import Path
+import hashlib
+import json
+import os
 import torch
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 import logging
 from ..embedders.bert_embedder import BertEmbedder
 
 logger = logging.getLogger(__name__)
 
+# Bumped when the stored embedding format changes (v2: unit-normalized rows)
+_CACHE_VERSION = 2
+
 class SimilarityCalculator:
     """
     A class to calculate cosine similarity between query and documents.
@@ -23,39 +29,193 @@ class SimilarityCalculator:
         The list of documents to calculate similarity for.
     batch_size : int, optional
         Batch size for processing documents.
+    cache_dir : Path, optional
+        Directory for the on-disk embedding cache. Defaults to
+        ``~/.cache/sre``. Embeddings are keyed by a content hash of
+        (model name, document text), so unchanged documents are never
+        re-embedded across runs.
     """
 
     def __init__(
         self,
         embedder: BertEmbedder,
         documents: List[str],
-        batch_size: int = 32
+        batch_size: int = 32,
+        cache_dir: Optional[Path] = None
     ):
         self.embedder = embedder
         self.documents = documents
         self.batch_size = batch_size
-        self.document_embeddings: List[torch.Tensor] = []
+        self.document_embeddings: Optional[torch.Tensor] = None
+        self.doc_matrix: Optional[torch.Tensor] = None
+        self._query_embeddings: dict = {}
+
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / '.cache' / 'sre'
+        model_hash = hashlib.sha256(
+            f"{embedder.model_name}:v{_CACHE_VERSION}".encode('utf-8')
+        ).hexdigest()[:16]
+        self._cache_file = self.cache_dir / f"{model_hash}.npy"
+        self._index_file = self.cache_dir / f"{model_hash}.json"
 
     def calculate_document_embeddings(self) -> None:
         """
-        Computes embeddings for all documents in batches.
+        Computes embeddings for all documents, reusing the on-disk cache.
+
+        Each document is keyed by a SHA256 of (model name, text); cached
+        rows are read from a float16 memmap and only cache misses go
+        through the BERT forward pass. Newly embedded documents are
+        appended to the cache for subsequent runs.
         """
         try:
-            self.document_embeddings = []
-            for i in range(0, len(self.documents), self.batch_size):
-                batch = self.documents[i:i + self.batch_size]
-                batch_embeddings = [
-                    self.embedder.get_sentence_embedding(doc)
-                    for doc in batch
-                ]
-                self.document_embeddings.extend(batch_embeddings)
-            
-            logger.info(f"Calculated embeddings for {len(self.documents)} documents")
-        
+            if not self.documents:
+                logger.warning("No documents to embed")
+                hidden_size = self.embedder.model.config.hidden_size
+                self.document_embeddings = torch.empty(0, hidden_size)
+                self.doc_matrix = self.document_embeddings
+                return
+
+            hashes = [
+                hashlib.sha256(
+                    (self.embedder.model_name + doc).encode('utf-8')
+                ).hexdigest()
+                for doc in self.documents
+            ]
+            index = self._load_cache_index()
+            cached_rows = self._load_cache_rows() if index else None
+            if index and cached_rows is None:
+                index = {}
+            if index and (
+                max(index.values()) >= cached_rows.shape[0]
+                or min(index.values()) < 0
+            ):
+                # Index and rows written by different runs (e.g. two
+                # processes racing on the shared cache); treat as corruption
+                logger.warning("Embedding cache index out of sync with rows, ignoring cache")
+                index = {}
+                cached_rows = None
+
+            misses = [i for i, h in enumerate(hashes) if h not in index]
+            miss_embeddings = (
+                self._embed_documents([self.documents[i] for i in misses])
+                if misses else None
+            )
+
+            hidden_size = (
+                miss_embeddings.shape[1] if miss_embeddings is not None
+                else cached_rows.shape[1]
+            )
+            embeddings = torch.empty(len(self.documents), hidden_size)
+            for i, doc_hash in enumerate(hashes):
+                if doc_hash in index:
+                    embeddings[i] = torch.from_numpy(
+                        np.asarray(cached_rows[index[doc_hash]], dtype=np.float32)
+                    )
+            if misses:
+                for j, i in enumerate(misses):
+                    embeddings[i] = miss_embeddings[j]
+                self._append_to_cache(
+                    index, [hashes[i] for i in misses], miss_embeddings
+                )
+
+            self.document_embeddings = embeddings
+            # Rows arrive unit-length from the embedder, so cosine
+            # similarity is one matmul with no re-normalization
+            self.doc_matrix = embeddings
+
+            logger.info(
+                f"Calculated embeddings for {len(self.documents)} documents "
+                f"({len(self.documents) - len(misses)} from cache)"
+            )
+
         except Exception as e:
             logger.error(f"Error calculating document embeddings: {str(e)}")
             raise
 
+    def _embed_documents(self, documents: List[str]) -> torch.Tensor:
+        """
+        Embeds a list of documents in length-sorted batches.
+
+        Documents are sorted by tokenized length before batching so that each
+        batch contains sentences of similar length, minimizing the padding
+        each batch is padded to. Each batch is embedded in a single BERT
+        forward pass and results are scattered back into input order as one
+        (len(documents), hidden_size) tensor.
+        """
+        # Sort by tokenized length so same-batch documents pad similarly;
+        # truncate like the embedding call does, so long documents are not
+        # fully tokenized just to measure a length capped at max_length
+        token_ids = self.embedder.tokenizer(
+            documents,
+            add_special_tokens=True,
+            truncation=True,
+            max_length=128
+        )['input_ids']
+        lengths = [len(ids) for ids in token_ids]
+        order = np.argsort(lengths)
+
+        embeddings = None
+        for i in range(0, len(order), self.batch_size):
+            batch_indices = order[i:i + self.batch_size]
+            batch = [documents[j] for j in batch_indices]
+            batch_embeddings = self.embedder.get_sentence_embeddings(batch)
+            if embeddings is None:
+                embeddings = torch.empty(
+                    len(documents),
+                    batch_embeddings.shape[1],
+                    dtype=batch_embeddings.dtype
+                )
+            embeddings[batch_indices] = batch_embeddings
+        return embeddings
+
+    def _load_cache_index(self) -> dict:
+        """Loads the hash -> row index of the embedding cache, if present."""
+        if self._index_file.exists() and self._cache_file.exists():
+            try:
+                with open(self._index_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, json.JSONDecodeError):
+                logger.warning("Embedding cache index unreadable, ignoring cache")
+        return {}
+
+    def _load_cache_rows(self) -> Optional[np.ndarray]:
+        """Memmaps the cached embedding rows, or None if unreadable."""
+        try:
+            return np.load(self._cache_file, mmap_mode='r')
+        except (OSError, ValueError):
+            logger.warning("Embedding cache rows unreadable, ignoring cache")
+            return None
+
+    def _append_to_cache(
+        self,
+        index: dict,
+        new_hashes: List[str],
+        new_embeddings: torch.Tensor
+    ) -> None:
+        """Appends freshly computed rows to the cache and rewrites the index."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            new_rows = new_embeddings.numpy().astype(np.float16)
+            if index:
+                existing = np.load(self._cache_file, mmap_mode='r')
+                rows = np.concatenate([existing, new_rows])
+            else:
+                rows = new_rows
+            start = rows.shape[0] - new_rows.shape[0]
+
+            # Write to a temp file and rename so a killed process never
+            # leaves a truncated .npy behind
+            tmp_file = self._cache_file.with_name(self._cache_file.name + '.tmp')
+            with open(tmp_file, 'wb') as f:
+                np.save(f, rows)
+            os.replace(tmp_file, self._cache_file)
+
+            for offset, doc_hash in enumerate(new_hashes):
+                index[doc_hash] = start + offset
+            with open(self._index_file, 'w', encoding='utf-8') as f:
+                json.dump(index, f)
+        except Exception as e:
+            logger.warning(f"Failed to update embedding cache: {str(e)}")
+
     def calculate_cosine_similarity(self, query: str) -> List[float]:
         """
         Computes cosine similarity between the query and all documents.
@@ -71,21 +231,18 @@ class SimilarityCalculator:
             Cosine similarity scores for each document.
         """
         try:
-            if not self.document_embeddings:
+            if self.doc_matrix is None:
                 logger.warning("Document embeddings not calculated. Running calculation now.")
                 self.calculate_document_embeddings()
 
-            query_embedding = self.embedder.get_sentence_embedding(query)
-            
-            similarities = [
-                float(cosine_similarity(
-                    query_embedding.reshape(1, -1),
-                    doc_embedding.reshape(1, -1)
-                )[0, 0])
-                for doc_embedding in self.document_embeddings
-            ]
-            
-            return similarities
+            # Reuse the query embedding when the same query repeats
+            query_embedding = self._query_embeddings.get(query)
+            if query_embedding is None:
+                query_embedding = self.embedder.get_sentence_embeddings([query])[0]
+                self._query_embeddings[query] = query_embedding
+            similarities = (self.doc_matrix @ query_embedding).cpu().numpy()
+
+            return similarities.tolist()
         
         except Exception as e:
             logger.error(f"Error calculating similarities: {str(e)}")
@@ -1,5 +1,9 @@
+import io
+import sys
 from datetime import datetime
 
+import numpy as np
+
 class ResultsDisplayer:
     """
     A class to display and save search results.
@@ -11,11 +15,20 @@ class ResultsDisplayer:
     def display_results(self, results, keyword, query):
         """
         Displays and saves the search results.
+
+        Each result is formatted once and emitted to both stdout and the
+        output file in a single pass.
         """
-        results = sorted(results, key=lambda x: x[1], reverse=True)
+        results = results[np.argsort(results['relevance'])[::-1]]
         timestamp = datetime.now().strftime(self.timestamp_format)
         output_filename = f"search_results_{timestamp}.txt"
-        
+
+        # Avoid a flush per printed line while streaming results
+        try:
+            sys.stdout.reconfigure(line_buffering=False)
+        except (AttributeError, io.UnsupportedOperation):
+            pass
+
         with open(output_filename, 'w', encoding='utf-8') as f:
             f.write(f"Search Results\n")
             f.write(f"Date and Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -23,34 +36,33 @@ class ResultsDisplayer:
             f.write(f"Keyword: {keyword}\n")
             f.write(f"Total Number of Documents Found: {len(results)}\n")
             f.write("-" * 50 + "\n\n")
-            
-            for idx, (filename, relevance_score, similarity, tfidf, count, percentage, avg_pos) in enumerate(results):
-                f.write(f"Document {idx + 1} - Title: {filename}\n")
-                f.write(f"Final Relevance Score: {relevance_score:.4f}\n")
-                f.write(f"Similarity Index with Query: {similarity:.4f}\n")
-                f.write(f"TF-IDF for Keyword '{keyword}': {tfidf:.4f}\n")
-                f.write(f"Occurrences of Keyword '{keyword}': {count}\n")
-                f.write(f"Percentage of Keyword '{keyword}': {percentage:.2f}%\n")
-                if avg_pos >= 0:
-                    f.write(f"Average Position of Keyword '{keyword}': {avg_pos}\n")
-                else:
-                    f.write(f"The keyword '{keyword}' is not present in the text.\n")
-                f.write("-" * 50 + "\n\n")
-        
+
+            for idx, result in enumerate(results):
+                self._emit(self._format_result(idx, result, keyword), f)
+
+        sys.stdout.flush()
         print(f"Results have been saved in file: {output_filename}")
-        for result in results:
-            self._print_result(result, keyword)
 
-    def _print_result(self, result, keyword):
+    def _format_result(self, idx, result, keyword):
+        """Formats a single result as a list of output lines."""
         filename, relevance_score, similarity, tfidf, count, percentage, avg_pos = result
-        print(f"Document - Title: {filename}")
-        print(f"Final Relevance Score: {relevance_score:.4f}")
-        print(f"Similarity Index with Query: {similarity:.4f}")
-        print(f"TF-IDF for Keyword '{keyword}': {tfidf:.4f}")
-        print(f"Occurrences of Keyword '{keyword}': {count}")
-        print(f"Percentage of Keyword '{keyword}': {percentage:.2f}%")
+        lines = [
+            f"Document {idx + 1} - Title: {filename}",
+            f"Final Relevance Score: {relevance_score:.4f}",
+            f"Similarity Index with Query: {similarity:.4f}",
+            f"TF-IDF for Keyword '{keyword}': {tfidf:.4f}",
+            f"Occurrences of Keyword '{keyword}': {count}",
+            f"Percentage of Keyword '{keyword}': {percentage:.2f}%",
+        ]
         if avg_pos >= 0:
-            print(f"Average Position of Keyword '{keyword}': {avg_pos}")
+            lines.append(f"Average Position of Keyword '{keyword}': {avg_pos}")
         else:
-            print(f"The keyword '{keyword}' is not present in the text.")
-        print("-" * 50)
+            lines.append(f"The keyword '{keyword}' is not present in the text.")
+        lines.append("-" * 50 + "\n")
+        return lines
+
+    def _emit(self, lines, fh):
+        """Writes formatted lines to both stdout and the output file."""
+        text = '\n'.join(lines) + '\n'
+        sys.stdout.write(text)
+        fh.write(text)
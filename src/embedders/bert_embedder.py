@@ -2,9 +2,14 @@
 Module for computing sentence embeddings using BERT.
 """
 
+import inspect
+import os
+
+import numpy as np
 import torch
-from transformers import BertModel, BertTokenizer
-from typing import Optional
+import torch.nn.functional as F
+from transformers import BertModel, AutoTokenizer
+from typing import List, Optional
 from pathlib import Path
 
 class BertEmbedder:
@@ -19,79 +24,246 @@ class BertEmbedder:
         Directory to cache the model.
     device : str, optional
         Device to run the model on ('cpu' or 'cuda').
+    backend : str, optional
+        Inference backend: 'pt' for eager PyTorch (default) or 'onnx' to
+        export once and run through ONNX Runtime, which avoids PyTorch
+        framework overhead on CPU. Requires the `onnxruntime` package.
+    num_threads : int, optional
+        Number of intra-op threads for CPU inference. Defaults to the CPU
+        count. This is a process-global torch setting.
+    num_interop_threads : int, optional
+        Number of inter-op threads for CPU inference. Defaults to a
+        quarter of the intra-op threads. This is a process-global torch
+        setting and can only be applied once per process.
     """
 
     def __init__(
-        self, 
+        self,
         model_name: str = 'bert-base-uncased',
         cache_dir: Optional[Path] = None,
-        device: Optional[str] = None
+        device: Optional[str] = None,
+        backend: str = 'pt',
+        num_threads: Optional[int] = None,
+        num_interop_threads: Optional[int] = None
     ):
+        if backend not in ('pt', 'onnx'):
+            raise ValueError(f"Unknown backend: {backend}")
+
+        # Allow TF32 tensor-core kernels for any remaining FP32 matmuls
+        torch.set_float32_matmul_precision('high')
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.benchmark = True
+
         self.device = device or ('cuda' if torch.cuda.is_available() else 'cpu')
+        self.model_name = model_name
         self.cache_dir = cache_dir
-        
-        # Initialize tokenizer and model
-        self.tokenizer = BertTokenizer.from_pretrained(
+        self.backend = backend
+
+        # Size the torch thread pools explicitly so the default interop
+        # pool does not fight the intra-op pool for cores
+        if self.device == 'cpu':
+            threads = num_threads or os.cpu_count() or 1
+            torch.set_num_threads(threads)
+            try:
+                torch.set_num_interop_threads(
+                    num_interop_threads or max(1, threads // 4)
+                )
+            except RuntimeError:
+                # Settable only once per process, before parallel work starts
+                pass
+
+        # Initialize tokenizer (Rust-backed fast tokenizer) and model
+        self.tokenizer = AutoTokenizer.from_pretrained(
             model_name,
-            cache_dir=cache_dir
+            cache_dir=cache_dir,
+            use_fast=True
         )
         self.model = BertModel.from_pretrained(
             model_name,
             cache_dir=cache_dir
-        ).to(self.device)
-        
-        # Set model to evaluation mode
+        )
         self.model.eval()
 
-    def get_sentence_embedding(
-        self, 
-        sentence: str,
+        if self.backend == 'onnx':
+            self.session = self._build_onnx_session()
+        else:
+            self.model = self.model.to(self.device)
+
+            if self.device.startswith('cuda'):
+                # Half precision: halves bandwidth, enables tensor cores
+                self.model = self.model.half()
+
+                # Fuse pointwise ops and cache CUDA graphs for repeat forwards
+                if hasattr(torch, 'compile'):
+                    self.model = torch.compile(
+                        self.model,
+                        mode='reduce-overhead',
+                        fullgraph=False,
+                        dynamic=False
+                    )
+            else:
+                # CPU inference is bandwidth-bound on weight loads; int8
+                # dynamic quantization of the Linear layers quarters the
+                # bytes moved per forward
+                self.model = torch.quantization.quantize_dynamic(
+                    self.model,
+                    {torch.nn.Linear},
+                    dtype=torch.qint8
+                )
+
+    def _build_onnx_session(self):
+        """
+        Exports the model to ONNX (once, cached on disk) and opens an
+        ONNX Runtime inference session for it.
+        """
+        import onnxruntime as ort
+
+        export_dir = Path(self.cache_dir) if self.cache_dir else Path.home() / '.cache' / 'sre'
+        export_dir.mkdir(parents=True, exist_ok=True)
+        onnx_path = export_dir / f"{self.model_name.replace('/', '_')}.onnx"
+
+        if not onnx_path.exists():
+            dummy = self.tokenizer(
+                "placeholder",
+                return_tensors="pt",
+                padding="max_length",
+                max_length=128
+            )
+            batch_and_sequence = {0: 'batch', 1: 'sequence'}
+
+            # Force the TorchScript exporter where torch offers a choice:
+            # the dynamo exporter needs onnxscript and ignores opset_version
+            export_kwargs = {}
+            if 'dynamo' in inspect.signature(torch.onnx.export).parameters:
+                export_kwargs['dynamo'] = False
+
+            torch.onnx.export(
+                self.model,
+                (dummy['input_ids'], dummy['attention_mask'], dummy['token_type_ids']),
+                str(onnx_path),
+                input_names=['input_ids', 'attention_mask', 'token_type_ids'],
+                output_names=['last_hidden_state'],
+                dynamic_axes={
+                    'input_ids': batch_and_sequence,
+                    'attention_mask': batch_and_sequence,
+                    'token_type_ids': batch_and_sequence,
+                    'last_hidden_state': batch_and_sequence,
+                },
+                opset_version=14,
+                **export_kwargs
+            )
+
+        return ort.InferenceSession(
+            str(onnx_path),
+            providers=['CUDAExecutionProvider', 'CPUExecutionProvider']
+        )
+
+    def get_sentence_embeddings(
+        self,
+        sentences: List[str],
         max_length: int = 128
     ) -> torch.Tensor:
         """
-        Computes the embedding for a given sentence.
+        Computes embeddings for a batch of sentences in a single forward pass.
 
         Parameters
         ----------
-        sentence : str
-            The input sentence.
+        sentences : list of str
+            The input sentences.
         max_length : int, optional
             Maximum sequence length.
 
         Returns
         -------
         torch.Tensor
-            The embedding vector for the sentence.
+            A (batch_size, hidden_size) tensor of embedding vectors.
 
         Notes
         -----
-        The embedding is computed by taking the mean of the last hidden states
-        of the BERT model over all tokens.
+        Each embedding is the mean of the last hidden states over the
+        non-padding tokens of its sentence, as given by the attention mask,
+        L2-normalized to unit length so cosine similarity between two
+        embeddings is a plain dot product.
         """
-        # Tokenize input
+        # Tokenize the whole batch with dynamic padding; rounding the padded
+        # length up to a multiple of 8 keeps FP16 matmuls on tensor cores
         inputs = self.tokenizer(
-            sentence,
+            sentences,
             return_tensors="pt",
             truncation=True,
-            padding="max_length",
+            padding=True,
+            pad_to_multiple_of=8,
             max_length=max_length
         )
-        
+
+        if self.backend == 'onnx':
+            return self._run_onnx(inputs)
+
         # Move inputs to device
         inputs = {k: v.to(self.device) for k, v in inputs.items()}
 
-        # Compute embeddings
-        with torch.no_grad():
+        # Compute embeddings (FP16 autocast on CUDA)
+        with torch.inference_mode(), torch.autocast(
+            device_type='cuda',
+            dtype=torch.float16,
+            enabled=self.device.startswith('cuda')
+        ):
             outputs = self.model(**inputs)
-            
-        # Get mean pooled output
-        embedding = outputs.last_hidden_state.mean(dim=1).squeeze()
-        
+
+        # Mean-pool over real tokens only, using the attention mask
+        mask = inputs['attention_mask'].unsqueeze(-1).float()
+        embeddings = (outputs.last_hidden_state * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+
+        # Keep downstream cosine similarity in full precision, and
+        # normalize once here so no caller ever has to re-normalize
+        embeddings = F.normalize(embeddings.float(), p=2, dim=-1)
+
         # Move back to CPU if needed
         if self.device != 'cpu':
-            embedding = embedding.cpu()
-            
-        return embedding
+            embeddings = embeddings.cpu()
+
+        return embeddings
+
+    def get_sentence_embedding(
+        self,
+        sentence: str,
+        max_length: int = 128
+    ) -> torch.Tensor:
+        """
+        Computes the embedding for a single sentence.
+
+        Parameters
+        ----------
+        sentence : str
+            The input sentence.
+        max_length : int, optional
+            Maximum sequence length.
+
+        Returns
+        -------
+        torch.Tensor
+            The embedding vector for the sentence.
+        """
+        return self.get_sentence_embeddings([sentence], max_length=max_length)[0]
+
+    def _run_onnx(self, inputs) -> torch.Tensor:
+        """
+        Runs the ONNX Runtime session on tokenized inputs and mean-pools
+        the last hidden states in NumPy.
+        """
+        inputs_np = {k: v.numpy() for k, v in inputs.items()}
+        last_hidden_state = self.session.run(
+            ['last_hidden_state'], inputs_np
+        )[0]
+
+        # Mean-pool over real tokens only, using the attention mask
+        mask = inputs_np['attention_mask'][:, :, None].astype(np.float32)
+        embeddings = (last_hidden_state * mask).sum(axis=1) / np.clip(
+            mask.sum(axis=1), 1e-9, None
+        )
+        return F.normalize(
+            torch.from_numpy(embeddings.astype(np.float32)), p=2, dim=-1
+        )
 
     def __call__(self, sentence: str) -> torch.Tensor:
         """
@@ -29,6 +29,8 @@ class TFIDFScorer:
         The TF-IDF vectorizer instance.
     tfidf_matrix : scipy.sparse.csr.csr_matrix
         The TF-IDF matrix for the documents.
+    tfidf_csc : scipy.sparse.csc.csc_matrix
+        Column-oriented copy of the TF-IDF matrix for fast keyword lookups.
     """
 
     def __init__(
@@ -43,6 +45,8 @@ class TFIDFScorer:
         )
         try:
             self.tfidf_matrix: csr_matrix = self.vectorizer.fit_transform(documents)
+            # CSC copy for O(nnz in column) keyword lookups in get_scores
+            self.tfidf_csc = self.tfidf_matrix.tocsc()
             logger.info(f"TF-IDF matrix shape: {self.tfidf_matrix.shape}")
         except Exception as e:
             logger.error(f"Error computing TF-IDF matrix: {str(e)}")
@@ -69,8 +73,12 @@ class TFIDFScorer:
             if keyword_index is None:
                 logger.warning(f"Keyword '{keyword}' not found in vocabulary")
                 return np.zeros(self.tfidf_matrix.shape[0])
-            
-            return self.tfidf_matrix[:, keyword_index].toarray().flatten()
+
+            # Scatter the sparse column into a dense vector without toarray()
+            column = self.tfidf_csc[:, keyword_index]
+            scores = np.zeros(self.tfidf_csc.shape[0])
+            scores[column.indices] = column.data
+            return scores
         
         except Exception as e:
             logger.error(f"Error computing scores for keyword '{keyword}': {str(e)}")
@@ -91,17 +99,20 @@ class TFIDFScorer:
             List of (term, score) tuples for top terms.
         """
         try:
-            scores = np.asarray(self.tfidf_matrix.sum(axis=0)).flatten()
+            scores = np.asarray(self.tfidf_matrix.sum(axis=0)).ravel()
             terms = self.vectorizer.get_feature_names_out()
-            
-            top_indices = scores.argsort()[-n:][::-1]
+
+            # Partial selection of the top n, then sort only those n terms
+            n = min(n, scores.shape[0])
+            top_indices = np.argpartition(scores, -n)[-n:]
+            top_indices = top_indices[np.argsort(-scores[top_indices])]
             return [(terms[i], scores[i]) for i in top_indices]
         
         except Exception as e:
             logger.error(f"Error getting top terms: {str(e)}")
             return []
 
-    def get_document_vector(self, document_index: int) -> np.ndarray:
+    def get_document_vector(self, document_index: int, dense: bool = False):
         """
         Gets the TF-IDF vector for a specific document.
 
@@ -109,10 +120,15 @@ class TFIDFScorer:
         ----------
         document_index : int
             Index of the document.
+        dense : bool, optional
+            If True, return a dense numpy array instead of the sparse row.
 
         Returns
         -------
-        numpy.ndarray
-            TF-IDF vector for the document.
+        scipy.sparse.csr.csr_matrix or numpy.ndarray
+            TF-IDF vector for the document, sparse unless `dense` is True.
         """
-        return self.tfidf_matrix[document_index].toarray().flatten()
+        row = self.tfidf_matrix[document_index]
+        if dense:
+            return row.toarray().ravel()
+        return row